@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import argparse
+import os
 import sys
+from multiprocessing import Pool
 from pathlib import Path
 
 from actionize.parser import parse_meeting_notes
-from actionize.formatter import format_markdown, format_json
+from actionize.formatter import format_markdown, write_json
 
 
 def _build_parser() -> argparse.ArgumentParser:
@@ -18,7 +20,12 @@ def _build_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "input_file",
         type=Path,
-        help="Path to the meeting-notes file (plain text or Markdown).",
+        nargs="+",
+        help=(
+            "Path to one or more meeting-notes files (plain text or Markdown). "
+            "With several files, each gets its own subdirectory of --out "
+            "named after the file stem."
+        ),
     )
     parser.add_argument(
         "--out",
@@ -29,32 +36,68 @@ def _build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def main(argv: list[str] | None = None) -> int:
-    """Entry point called by the console script and ``python -m actionize``."""
-    parser = _build_parser()
-    args = parser.parse_args(argv)
-
-    input_path: Path = args.input_file.resolve()
-    output_dir: Path = args.out.resolve()
-
-    if not input_path.is_file():
-        print(f"Error: input file not found: {input_path}", file=sys.stderr)
-        return 1
+def _process_one(input_path: Path, output_dir: Path) -> tuple[int, Path, Path]:
+    """Parse *input_path* and write both output files into *output_dir*.
 
+    Returns
+    -------
+    tuple[int, Path, Path]
+        The item count and the Markdown and JSON paths written.
+    """
     text = input_path.read_text(encoding="utf-8")
     items = parse_meeting_notes(text)
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
     md_path = output_dir / "action_items.md"
-    md_path.write_text(format_markdown(items), encoding="utf-8")
+    # Same "\n" line endings as write_json, whatever the platform.
+    md_path.write_text(format_markdown(items), encoding="utf-8", newline="\n")
 
     json_path = output_dir / "action_items.json"
-    json_path.write_text(format_json(items), encoding="utf-8")
+    write_json(items, json_path)
+
+    return len(items), md_path, json_path
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point called by the console script and ``python -m actionize``."""
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+
+    input_paths: list[Path] = [path.resolve() for path in args.input_file]
+    output_dir: Path = args.out.resolve()
+
+    for input_path in input_paths:
+        if not input_path.is_file():
+            print(f"Error: input file not found: {input_path}", file=sys.stderr)
+            return 1
+
+    if len(input_paths) == 1:
+        count, md_path, json_path = _process_one(input_paths[0], output_dir)
+        print(f"Extracted {count} action item(s).")
+        print(f"  Markdown -> {md_path}")
+        print(f"  JSON     -> {json_path}")
+        return 0
+
+    stems = [path.stem for path in input_paths]
+    duplicates = sorted({stem for stem in stems if stems.count(stem) > 1})
+    if duplicates:
+        print(
+            f"Error: input files share a name: {', '.join(duplicates)}",
+            file=sys.stderr,
+        )
+        return 1
+
+    # Files are independent and parsing is CPU-bound, so fan out to processes.
+    jobs = [(path, output_dir / path.stem) for path in input_paths]
+    processes = min(len(jobs), os.cpu_count() or 1)
+    with Pool(processes=processes) as pool:
+        results = pool.starmap(_process_one, jobs)
 
-    print(f"Extracted {len(items)} action item(s).")
-    print(f"  Markdown -> {md_path}")
-    print(f"  JSON     -> {json_path}")
+    for input_path, (count, md_path, json_path) in zip(input_paths, results):
+        print(f"Extracted {count} action item(s) from {input_path.name}.")
+        print(f"  Markdown -> {md_path}")
+        print(f"  JSON     -> {json_path}")
     return 0
 
 
@@ -3,12 +3,20 @@
 from __future__ import annotations
 
 import json
-from dataclasses import asdict
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TextIO
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from actionize.parser import ActionItem
 
+_ORJSON_OPTIONS = orjson.OPT_INDENT_2 if orjson else 0
+
 
 def sort_items(items: list[ActionItem]) -> list[ActionItem]:
     """Sort action items by owner (ascending) then due_date (ascending).
@@ -26,13 +34,21 @@ def sort_items(items: list[ActionItem]) -> list[ActionItem]:
     list[ActionItem]
         A new list in deterministic order.
     """
-
-    def _sort_key(item: ActionItem) -> tuple[bool, str, bool, str]:
-        owner_unknown = item.owner.lower() in ("", "unassigned")
-        date_unknown = item.due_date == ""
-        return (owner_unknown, item.owner.lower(), date_unknown, item.due_date)
-
-    return sorted(items, key=_sort_key)
+    # Decorate-sort-undecorate: lowercase each owner once, and use the input
+    # index as a tie-breaker so items are never compared and order is stable.
+    decorated: list[tuple[bool, str, bool, str, int, ActionItem]] = []
+    for index, item in enumerate(items):
+        owner = item.owner.lower()
+        decorated.append((
+            owner in ("", "unassigned"),
+            owner,
+            item.due_date == "",
+            item.due_date,
+            index,
+            item,
+        ))
+    decorated.sort()
+    return [entry[-1] for entry in decorated]
 
 
 def format_markdown(items: list[ActionItem]) -> str:
@@ -66,22 +82,105 @@ def format_markdown(items: list[ActionItem]) -> str:
     return "\n".join(lines)
 
 
-def format_json(items: list[ActionItem]) -> str:
+def _build_payload(items: list[ActionItem]) -> dict[str, object]:
+    """Return the JSON-ready document for *items* (sorted internally)."""
+    sorted_items = sort_items(items)
+    # Keys are inserted in alphabetical order so the encoders can emit them
+    # as-is; this replaces a sort_keys pass on every serialization.
+    return {
+        # ActionItem holds only immutable strings, so build each dict
+        # directly rather than paying for asdict()'s recursive deep copy.
+        "action_items": [
+            {
+                "due_date": item.due_date,
+                "owner": item.owner,
+                "priority": item.priority,
+                "raw_line": item.raw_line,
+                "task": item.task,
+            }
+            for item in sorted_items
+        ],
+        "count": len(sorted_items),
+    }
+
+
+def _orjson_dumps(payload: dict[str, object]) -> bytes | None:
+    """Encode *payload* with orjson, or return ``None`` to use the stdlib.
+
+    orjson's indent-2 output is byte-identical to
+    ``json.dumps(..., indent=2, ensure_ascii=False)``.
+    """
+    if orjson is None:
+        return None
+    try:
+        return orjson.dumps(payload, option=_ORJSON_OPTIONS) + b"\n"
+    except orjson.JSONEncodeError:
+        # e.g. lone surrogates, which the stdlib encoder passes through
+        return None
+
+
+def format_json(items: list[ActionItem], fp: TextIO | None = None) -> str | None:
     """Render a sorted list of action items as a JSON document.
 
     Parameters
     ----------
     items:
         Action items to render (will be sorted internally).
+    fp:
+        Optional text file object.  When given, the document is streamed
+        into it instead of being built in memory.
 
     Returns
     -------
-    str
-        A pretty-printed JSON string with deterministic key order.
+    str | None
+        A pretty-printed JSON string with deterministic key order, or
+        ``None`` when *fp* was given.
     """
-    sorted_items = sort_items(items)
-    payload = {
-        "action_items": [asdict(item) for item in sorted_items],
-        "count": len(sorted_items),
-    }
-    return json.dumps(payload, indent=2, sort_keys=True, ensure_ascii=False) + "\n"
+    payload = _build_payload(items)
+    if fp is not None:
+        json.dump(payload, fp, indent=2, ensure_ascii=False)
+        fp.write("\n")
+        return None
+    encoded = _orjson_dumps(payload)
+    if encoded is not None:
+        return encoded.decode("utf-8")
+    return json.dumps(payload, indent=2, ensure_ascii=False) + "\n"
+
+
+def format_json_bytes(items: list[ActionItem]) -> bytes:
+    """Render action items as UTF-8 encoded JSON, ready to write to disk.
+
+    Uses ``orjson`` when it is installed, which skips the decode/encode
+    round-trip of ``format_json(items).encode()``.
+
+    Parameters
+    ----------
+    items:
+        Action items to render (will be sorted internally).
+
+    Returns
+    -------
+    bytes
+        The same document as :func:`format_json`, encoded as UTF-8.
+    """
+    payload = _build_payload(items)
+    encoded = _orjson_dumps(payload)
+    if encoded is not None:
+        return encoded
+    return (
+        json.dumps(payload, indent=2, ensure_ascii=False) + "\n"
+    ).encode("utf-8")
+
+
+def write_json(items: list[ActionItem], path: Path) -> None:
+    """Write the JSON document for *items* to *path* as UTF-8.
+
+    With ``orjson`` installed the encoded bytes are written in one go;
+    otherwise the stdlib encoder streams into the file.  Lines end in
+    ``"\\n"`` on every platform either way.
+    """
+    if orjson is not None:
+        path.write_bytes(format_json_bytes(items))
+        return
+    with path.open("w", encoding="utf-8", newline="\n") as fp:
+        format_json(items, fp)
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import io
 import re
+import sys
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import date, timedelta
+from functools import lru_cache
 
 
 @dataclass(frozen=True, slots=True)
@@ -22,35 +26,44 @@ class ActionItem:
 # Month-name lookup
 # ---------------------------------------------------------------------------
 
-_MONTH_NAMES: dict[str, int] = {
-    "jan": 1, "january": 1,
-    "feb": 2, "february": 2,
-    "mar": 3, "march": 3,
-    "apr": 4, "april": 4,
-    "may": 5,
-    "jun": 6, "june": 6,
-    "jul": 7, "july": 7,
-    "aug": 8, "august": 8,
-    "sep": 9, "sept": 9, "september": 9,
-    "oct": 10, "october": 10,
-    "nov": 11, "november": 11,
-    "dec": 12, "december": 12,
+# Every month is uniquely identified by its first three letters, so lookups
+# go through a 3-char prefix table and are then validated against the full
+# name: "Feb", "Sept", "September" resolve, "Marching" does not.
+_MONTH_FULL_NAMES: tuple[str, ...] = (
+    "january", "february", "march", "april", "may", "june",
+    "july", "august", "september", "october", "november", "december",
+)
+_MONTH_PREFIXES: dict[str, int] = {
+    name[:3]: number for number, name in enumerate(_MONTH_FULL_NAMES, start=1)
 }
 
 # ---------------------------------------------------------------------------
 # Day-of-week lookup (Monday=0 ... Sunday=6, matching date.weekday())
 # ---------------------------------------------------------------------------
 
-_DAY_NAMES: dict[str, int] = {
-    "monday": 0, "mon": 0,
-    "tuesday": 1, "tue": 1, "tues": 1,
-    "wednesday": 2, "wed": 2,
-    "thursday": 3, "thu": 3, "thurs": 3, "thur": 3,
-    "friday": 4, "fri": 4,
-    "saturday": 5, "sat": 5,
-    "sunday": 6, "sun": 6,
+_DAY_FULL_NAMES: tuple[str, ...] = (
+    "monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday",
+)
+_DAY_PREFIXES: dict[str, int] = {
+    name[:3]: weekday for weekday, name in enumerate(_DAY_FULL_NAMES)
 }
 
+
+def _month_number(name: str) -> int | None:
+    """Return the month (1-12) for a lowercase month name or abbreviation."""
+    month = _MONTH_PREFIXES.get(name[:3])
+    if month is not None and _MONTH_FULL_NAMES[month - 1].startswith(name):
+        return month
+    return None
+
+
+def _weekday_number(name: str) -> int | None:
+    """Return the weekday (Monday=0) for a lowercase day name or abbreviation."""
+    weekday = _DAY_PREFIXES.get(name[:3])
+    if weekday is not None and _DAY_FULL_NAMES[weekday].startswith(name):
+        return weekday
+    return None
+
 # ---------------------------------------------------------------------------
 # Priority mapping
 # ---------------------------------------------------------------------------
@@ -61,12 +74,25 @@ _PRIORITY_MAP: dict[str, str] = {
     "p2": "normal",
 }
 
+# ---------------------------------------------------------------------------
+# Date patterns used by normalize_date
+# ---------------------------------------------------------------------------
+
+# Date digits are ASCII-only on every path.  re.ASCII does that for
+# patterns without \s or \w; the others spell digits as [0-9] and stay
+# Unicode-aware so non-breaking spaces from pasted notes still count.
+_RE_QUARTER = re.compile(r"q[1-4]")
+_RE_NEXT_DAY = re.compile(r"next\s+(\w+)")
+_RE_SLASH_DATE = re.compile(r"(\d{1,2})/(\d{1,2})(?:/(\d{2,4}))?", re.ASCII)
+_RE_MONTH_DAY = re.compile(r"(\w+)\s+([0-9]{1,2})(?:\s*,?\s*([0-9]{4}))?", re.IGNORECASE)
+_RE_DAY_MONTH = re.compile(r"([0-9]{1,2})\s+(\w+)(?:\s*,?\s*([0-9]{4}))?", re.IGNORECASE)
+
 
 # ===================================================================
 # normalize_date
 # ===================================================================
 
-def normalize_date(raw: str) -> str:
+def normalize_date(raw: str, today: date | None = None) -> str:
     """Best-effort conversion of a free-form date string to ISO-8601.
 
     Returns an empty string when the input cannot be interpreted.
@@ -75,6 +101,9 @@ def normalize_date(raw: str) -> str:
     ----------
     raw:
         A human-written date fragment, e.g. "Feb 14", "2026-02-14", "next Friday".
+    today:
+        The reference date for relative and year-less inputs.  Defaults to
+        ``date.today()``; pass it explicitly when normalizing many dates.
 
     Returns
     -------
@@ -85,26 +114,44 @@ def normalize_date(raw: str) -> str:
     if not raw:
         return ""
 
-    today = date.today()
-
-    # 1) Already ISO-8601: "2026-02-28"
-    try:
-        parsed = date.fromisoformat(raw)
-        return parsed.isoformat()
-    except ValueError:
-        pass
+    if today is None:
+        today = date.today()
+    # Keying on today's ordinal makes relative results expire at midnight.
+    return _normalize_date_cached(raw, today.toordinal())
+
+
+@lru_cache(maxsize=2048)
+def _normalize_date_cached(raw: str, today_ordinal: int) -> str:
+    """Memoized body of :func:`normalize_date` for a stripped, non-empty *raw*."""
+    today = date.fromordinal(today_ordinal)
+
+    # 1) Already ISO-8601: "2026-02-28".  Cheap shape check first so free-form
+    #    input never pays for a raised-and-caught ValueError.
+    if (
+        len(raw) == 10
+        and raw.isascii()
+        and raw[4] == "-"
+        and raw[7] == "-"
+        and raw[:4].isdigit()
+        and raw[5:7].isdigit()
+        and raw[8:].isdigit()
+    ):
+        try:
+            return date.fromisoformat(raw).isoformat()
+        except ValueError:
+            pass
 
     lowered = raw.lower()
 
     # 2) Quarter references (Q1, Q2, etc.) -- not precise enough
-    if re.fullmatch(r"q[1-4]", lowered):
+    if _RE_QUARTER.fullmatch(lowered):
         return ""
 
     # 3) Relative day: "next Monday", "next Friday", etc.
-    m_relative = re.fullmatch(r"next\s+(\w+)", lowered)
+    m_relative = _RE_NEXT_DAY.fullmatch(lowered)
     if m_relative:
         day_name = m_relative.group(1)
-        target_weekday = _DAY_NAMES.get(day_name)
+        target_weekday = _weekday_number(day_name)
         if target_weekday is not None:
             current_weekday = today.weekday()
             days_ahead = (target_weekday - current_weekday) % 7
@@ -124,7 +171,7 @@ def normalize_date(raw: str) -> str:
         return (today + timedelta(days=1)).isoformat()
 
     # 5) US-style slash date: "2/20", "2/20/2026", "02/20/2026"
-    m_slash = re.fullmatch(r"(\d{1,2})/(\d{1,2})(?:/(\d{2,4}))?", raw)
+    m_slash = _RE_SLASH_DATE.fullmatch(raw)
     if m_slash:
         month = int(m_slash.group(1))
         day = int(m_slash.group(2))
@@ -142,13 +189,19 @@ def normalize_date(raw: str) -> str:
 
     # 6) Month-name date: "March 1", "Feb 14", "February 14, 2026",
     #    "14 March", "14 March 2026"
+    # Fast path: plain whitespace tokens looked up directly by month name
+    parts = raw.split()
+    if len(parts) in (2, 3):
+        result = _date_from_month_tokens(parts, today.year)
+        if result is not None:
+            return result
+
+    # Fallback for irregular spacing/commas, e.g. "Feb 14,2026"
     # Pattern A: "Month Day[, Year]"
-    m_month_day = re.fullmatch(
-        r"(\w+)\s+(\d{1,2})(?:\s*,?\s*(\d{4}))?", raw, re.IGNORECASE
-    )
+    m_month_day = _RE_MONTH_DAY.fullmatch(raw)
     if m_month_day:
         month_str = m_month_day.group(1).lower()
-        month = _MONTH_NAMES.get(month_str)
+        month = _month_number(month_str)
         if month is not None:
             day = int(m_month_day.group(2))
             year = int(m_month_day.group(3)) if m_month_day.group(3) else today.year
@@ -158,13 +211,11 @@ def normalize_date(raw: str) -> str:
                 return ""
 
     # Pattern B: "Day Month[, Year]"
-    m_day_month = re.fullmatch(
-        r"(\d{1,2})\s+(\w+)(?:\s*,?\s*(\d{4}))?", raw, re.IGNORECASE
-    )
+    m_day_month = _RE_DAY_MONTH.fullmatch(raw)
     if m_day_month:
         day = int(m_day_month.group(1))
         month_str = m_day_month.group(2).lower()
-        month = _MONTH_NAMES.get(month_str)
+        month = _month_number(month_str)
         if month is not None:
             year = int(m_day_month.group(3)) if m_day_month.group(3) else today.year
             try:
@@ -176,113 +227,278 @@ def normalize_date(raw: str) -> str:
     return ""
 
 
+def _is_ascii_number(token: str) -> bool:
+    """Return ``True`` if *token* is a non-empty run of the digits 0-9."""
+    return token.isascii() and token.isdigit()
+
+
+def _date_from_month_tokens(parts: list[str], default_year: int) -> str | None:
+    """Resolve ``Month Day [Year]`` / ``Day Month [Year]`` tokens.
+
+    Returns an ISO-8601 string, ``""`` for an impossible date, or ``None``
+    when *parts* do not have a recognizable shape and the caller should
+    fall back to the month-name regexes.
+    """
+    if len(parts) == 3:
+        year_str = parts[2]
+        if len(year_str) != 4 or not _is_ascii_number(year_str):
+            return None
+        year = int(year_str)
+        first, second = parts[0], parts[1].removesuffix(",")
+    else:
+        year = default_year
+        first, second = parts
+
+    if len(second) <= 2 and _is_ascii_number(second):
+        # Pattern A: "Month Day"
+        month = _month_number(first.lower())
+        day = int(second)
+    elif len(first) <= 2 and _is_ascii_number(first):
+        # Pattern B: "Day Month"
+        month = _month_number(second.lower())
+        day = int(first)
+    else:
+        return None
+
+    if month is None:
+        return None
+    try:
+        return date(year, month, day).isoformat()
+    except ValueError:
+        return ""
+
+
 # ===================================================================
 # Internal helpers for parse_meeting_notes
 # ===================================================================
 
-def _extract_priority(line: str) -> str:
-    """Return the priority level found in *line*, or ``"normal"``."""
-    m = re.search(r"\(?\b(P[012])\b\)?", line, re.IGNORECASE)
-    if m:
-        return _PRIORITY_MAP.get(m.group(1).lower(), "normal")
+# Case-insensitive tags, found together in one pass over the pre-lowercased
+# line (so written in lowercase, without re.IGNORECASE): "(owner Name)" and
+# "P0"/"(P1)"/"Priority: P2".  Neither branch can match inside the other,
+# so scanning them together finds the first of each.
+_RE_INLINE_TAGS = re.compile(
+    r"\(owner\s+(?P<owner>[a-z]+(?:\s+[a-z]+)?)\)"
+    r"|\(?\b(?P<priority>p[012])\b\)?"
+)
+
+# Case-sensitive lookups run against the original line.
+# "Due: <date>" / "due <date>" or "by <date>" -- the date runs until
+# punctuation/semicolon/EOL.  ``due`` is set only for the first form.
+_RE_DUE_OR_BY = re.compile(r"(?:(?P<due>[Dd]ue):?\s+|(?i:\bby)\s+)(?P<date>[^;.\n]+)")
 
-    m2 = re.search(r"Priority:\s*(P[012])\b", line, re.IGNORECASE)
-    if m2:
-        return _PRIORITY_MAP.get(m2.group(1).lower(), "normal")
+_RE_TRAILING_PRIORITY = re.compile(r"\s*\(P[012]\)\s*$", re.IGNORECASE)
+_RE_TRAILING_SEMICOLON = re.compile(r"\s*;\s*$")
 
-    return "normal"
 
+def _lower_preserving_offsets(line: str) -> str:
+    """Lowercase *line* so that every index still lines up with *line*."""
+    lowered = line.lower()
+    if len(lowered) == len(line):
+        return lowered
+    # A few characters (e.g. "\u0130") grow when lowercased; keep the first
+    # code point of each so match spans can be sliced from the original.
+    return "".join(ch.lower()[0] for ch in line)
 
-def _extract_owner(line: str) -> str:
-    """Return the owner name found in *line*, or ``"unassigned"``."""
-    # "Owner: Name" (possibly followed by punctuation / semicolon / period)
-    m = re.search(r"Owner:\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)", line)
-    if m:
-        return m.group(1).strip()
 
-    # "(owner Name)"
-    m2 = re.search(r"\(owner\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\)", line, re.IGNORECASE)
-    if m2:
-        return m2.group(1).strip()
+def _scan_inline_tags(line_lower: str) -> tuple[str, tuple[int, int] | None]:
+    """Return the priority level and the span of an "(owner Name)" name.
+
+    Both come from a single scan of *line_lower*.  The priority defaults to
+    ``"normal"``; the span is ``None`` when there is no parenthetical owner.
+    """
+    priority: str | None = None
+    owner_span: tuple[int, int] | None = None
+    for m in _RE_INLINE_TAGS.finditer(line_lower):
+        if m.group("priority") is not None:
+            if priority is None:
+                priority = _PRIORITY_MAP.get(m.group("priority"), "normal")
+        elif owner_span is None:
+            owner_span = m.span("owner")
+        if priority is not None and owner_span is not None:
+            break
+    return priority or "normal", owner_span
+
+
+def _capitalized_word_end(text: str, start: int) -> int:
+    """Return the end of an ``[A-Z][a-z]+`` word at *start*, or ``-1``."""
+    if start >= len(text) or not "A" <= text[start] <= "Z":
+        return -1
+    end = start + 1
+    while end < len(text) and "a" <= text[end] <= "z":
+        end += 1
+    return end if end > start + 1 else -1
+
+
+def _scan_owner_label(line: str) -> str:
+    """Return the one- or two-word name after ``Owner:`` in *line*, or ``""``.
+
+    Each word is ``[A-Z][a-z]+``; whitespace may follow the label and must
+    separate the words.  Later labels are tried if the first has no name.
+    """
+    idx = line.find("Owner:")
+    while idx >= 0:
+        start = idx + len("Owner:")
+        while start < len(line) and line[start].isspace():
+            start += 1
+        end = _capitalized_word_end(line, start)
+        if end >= 0:
+            gap = end
+            while gap < len(line) and line[gap].isspace():
+                gap += 1
+            if gap > end:
+                second_end = _capitalized_word_end(line, gap)
+                if second_end >= 0:
+                    end = second_end
+            return line[start:end]
+        idx = line.find("Owner:", idx + 1)
+    return ""
+
+
+def _extract_owner(line: str, paren_span: tuple[int, int] | None) -> str:
+    """Return the owner name found in *line*, or ``"unassigned"``.
+
+    *paren_span* is the "(owner Name)" span found by :func:`_scan_inline_tags`.
+    """
+    # "Owner: Name" (possibly followed by punctuation / semicolon / period)
+    name = _scan_owner_label(line)
+    if name:
+        return name
 
-    # Detect "(no owner yet)" and similar explicit unassigned markers
-    if re.search(r"\(no\s+owner", line, re.IGNORECASE):
-        return "unassigned"
+    # "(owner Name)" -- matched in lowercase, returned in its original case
+    if paren_span is not None:
+        return line[paren_span[0]:paren_span[1]]
 
+    # "(no owner yet)" and similar explicit markers are unassigned too
     return "unassigned"
 
 
-def _extract_due_date(line: str) -> str:
-    """Return a normalized due date found in *line*, or ``""``."""
-    # "Due: <date>" or "due <date>" -- capture until punctuation/semicolon/EOL
-    m = re.search(r"[Dd]ue:?\s+([^;.\n]+)", line)
-    if m:
-        raw_date = m.group(1).strip().rstrip(".")
-        # Remove trailing priority tags like "(P1)" from the date string
-        raw_date = re.sub(r"\s*\(P[012]\)\s*$", "", raw_date, flags=re.IGNORECASE)
-        result = normalize_date(raw_date)
-        if result:
-            return result
+def _normalize_date_fragment(fragment: str, today: date) -> str:
+    """Normalize a captured due-date fragment, ignoring a trailing "(P1)" tag."""
+    raw_date = _RE_TRAILING_PRIORITY.sub("", fragment.strip().rstrip("."))
+    return normalize_date(raw_date, today)
 
-    # "by <date>" pattern
-    m2 = re.search(r"\bby\s+([^;.\n]+)", line, re.IGNORECASE)
-    if m2:
-        raw_date = m2.group(1).strip().rstrip(".")
-        raw_date = re.sub(r"\s*\(P[012]\)\s*$", "", raw_date, flags=re.IGNORECASE)
-        result = normalize_date(raw_date)
-        if result:
-            return result
 
-    return ""
+def _extract_due_date(line: str, today: date) -> str:
+    """Return a normalized due date found in *line*, or ``""``.
+
+    The first ``Due:`` fragment wins when it holds a usable date; otherwise
+    the first ``by`` fragment is used.  Both are found in a single scan.
+    """
+    due_seen = False
+    by_date: str | None = None
+    pos = 0
+    while not (due_seen and by_date is not None):
+        m = _RE_DUE_OR_BY.search(line, pos)
+        if m is None:
+            break
+        # Resume inside the captured text so "Due: by March 1" still
+        # finds its nested "by" fragment.
+        pos = m.start("date")
+        if m.group("due") is not None:
+            if due_seen:
+                continue
+            due_seen = True
+            result = _normalize_date_fragment(m.group("date"), today)
+            if result:
+                return result
+        elif by_date is None:
+            by_date = _normalize_date_fragment(m.group("date"), today)
+
+    return by_date or ""
+
+
+# Every inline metadata fragment stripped from task text, in the order they
+# are applied.  Each substitution sees the previous one's output (e.g. the
+# "by <date>" pattern needs the space a later "Priority:" strip would eat),
+# so they are not fused into a single alternation.
+_METADATA_PATTERNS: tuple[re.Pattern[str], ...] = (
+    # "Owner: Name" fragments
+    re.compile(r"\s*;?\s*Owner:\s*[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?\s*;?"),
+    # "(owner Name)" fragments
+    re.compile(r"\s*\(owner\s+\w+\)", re.IGNORECASE),
+    # "Due: ..." fragments
+    re.compile(r"\s*;?\s*[Dd]ue:?\s+[^;.\n]+"),
+    # "by <date>" fragments only when they look like a date
+    re.compile(
+        r"\s+by\s+(?:next\s+\w+|\d{1,2}/\d{1,2}(?:/\d{2,4})?|\d{4}-\d{2}-\d{2}|"
+        r"(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*\s+\d{1,2}(?:\s*,?\s*\d{4})?)",
+        re.IGNORECASE,
+    ),
+    # "Priority: P0/P1/P2"
+    re.compile(r"\s*;?\s*Priority:\s*P[012]\s*;?", re.IGNORECASE),
+    # Standalone "(P0)", "(P1)", "(P2)"
+    re.compile(r"\s*\(P[012]\)", re.IGNORECASE),
+    # "(no owner yet)" and similar
+    re.compile(r"\s*\(no\s+owner\s+\w*\)", re.IGNORECASE),
+)
+
+# Lowercase literals at least one of which must appear for any of the
+# _METADATA_PATTERNS to match; text containing none of them skips them all.
+_METADATA_ANCHORS: tuple[str, ...] = ("owner:", "(", "due", "by", "priority:")
 
 
 def _clean_task_text(task: str) -> str:
     """Remove inline metadata annotations from extracted task text."""
-    # Strip "Owner: Name" fragments
-    task = re.sub(r"\s*;?\s*Owner:\s*[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?\s*;?", "", task)
-    # Strip "(owner Name)" fragments
-    task = re.sub(r"\s*\(owner\s+\w+\)", "", task, flags=re.IGNORECASE)
-    # Strip "Due: ..." fragments
-    task = re.sub(r"\s*;?\s*[Dd]ue:?\s+[^;.\n]+", "", task)
-    # Strip "by <date>" fragments only when they look like a date
-    task = re.sub(r"\s+by\s+(?:next\s+\w+|\d{1,2}/\d{1,2}(?:/\d{2,4})?|"
-                  r"\d{4}-\d{2}-\d{2}|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*\s+\d{1,2}(?:\s*,?\s*\d{4})?)",
-                  "", task, flags=re.IGNORECASE)
-    # Strip "Priority: P0/P1/P2"
-    task = re.sub(r"\s*;?\s*Priority:\s*P[012]\s*;?", "", task, flags=re.IGNORECASE)
-    # Strip standalone "(P0)", "(P1)", "(P2)"
-    task = re.sub(r"\s*\(P[012]\)", "", task, flags=re.IGNORECASE)
-    # Strip "(no owner yet)" and similar
-    task = re.sub(r"\s*\(no\s+owner\s+\w*\)", "", task, flags=re.IGNORECASE)
+    lowered = task.lower()
+    if any(anchor in lowered for anchor in _METADATA_ANCHORS):
+        for pattern in _METADATA_PATTERNS:
+            task = pattern.sub("", task)
     # Clean up residual punctuation/whitespace
-    task = re.sub(r"\s*;\s*$", "", task)
-    task = re.sub(r"\s{2,}", " ", task)
-    return task.strip().rstrip(".").strip()
+    task = _RE_TRAILING_SEMICOLON.sub("", task)
+    task = " ".join(task.split())
+    return task.rstrip(".").strip()
 
 
 # ===================================================================
 # parse_meeting_notes
 # ===================================================================
 
-# Patterns that indicate a line is an action item
-_RE_TODO = re.compile(r"^TODO:\s*(.+)", re.IGNORECASE)
-_RE_ACTION = re.compile(r"^Action:\s*(.+)", re.IGNORECASE)
-_RE_ACTION_ITEM = re.compile(r"^ACTION\s+ITEM\s*(?:--|[\u2014:\-])\s*(.+)", re.IGNORECASE)
-_RE_REMINDER = re.compile(r"^Reminder:\s*(.+)", re.IGNORECASE)
-_RE_NAME_TO_VERB = re.compile(
-    r"^([A-Z][a-z]+)\s+to\s+(draft|send|create|write|fix|update|review|prepare|"
-    r"build|design|implement|schedule|reach|migrate|set\s+up|check|follow|complete|"
-    r"submit|finalize|organize|coordinate|investigate|test|deploy|audit|document|"
-    r"analyze|configure|remove|add|refactor|propose|plan|outline|establish)\b(.+)?",
+# Patterns that indicate a line is an action item, fused into one anchored
+# alternation so each line is classified with a single match.  Branches are
+# tried in priority order; ``lastgroup`` names the branch that matched.
+_RE_CLASSIFIER = re.compile(
+    r"^(?:"
+    r"(?P<todo>TODO:\s*(?P<todo_text>.+))"
+    r"|(?P<action>Action:\s*(?P<action_text>.+))"
+    r"|(?P<action_item>ACTION\s+ITEM\s*(?:--|[\u2014:\-])\s*(?P<action_item_text>.+))"
+    r"|(?P<reminder>Reminder:\s*(?P<reminder_text>.+))"
+    r"|(?P<name_to_verb>(?P<owner>[A-Z][a-z]+)\s+to\s+(?P<verb>draft|send|create|write|fix|"
+    r"update|review|prepare|build|design|implement|schedule|reach|migrate|set\s+up|check|"
+    r"follow|complete|submit|finalize|organize|coordinate|investigate|test|deploy|audit|"
+    r"document|analyze|configure|remove|add|refactor|propose|plan|outline|establish)\b"
+    r"(?P<rest>.+)?)"
+    r")",
     re.IGNORECASE,
 )
 
+# Lowercase prefixes of the prefix-anchored _RE_CLASSIFIER branches
+_ACTION_PREFIXES: tuple[str, ...] = ("todo:", "action", "reminder:")
+
 # Patterns that indicate a line is NOT an action item
 _RE_DECISION = re.compile(r"(?:^|\W)Decisions?:\s*", re.IGNORECASE)
 
 # Priority-only lines: lines that contain (P0)/(P1)/(P2) suggesting urgency
 _RE_PRIORITY_TAG = re.compile(r"\(P[012]\)", re.IGNORECASE)
 
+# Line boundaries recognized by str.splitlines() beyond \n, \r and \r\n.
+_RE_EXTRA_LINE_BREAKS = re.compile("[\x0b\x0c\x1c-\x1e\x85\u2028\u2029]")
+
+
+def _may_be_action(line: str, line_lower: str) -> bool:
+    """Cheap pre-check that rejects most non-action lines without regex.
+
+    Returns ``True`` for every line that _RE_CLASSIFIER or _RE_PRIORITY_TAG
+    could match (and some they will not), ``False`` only when neither can.
+    """
+    if line_lower.startswith(_ACTION_PREFIXES):
+        return True
+    # "(P0)" / "(P1)" / "(P2)" anywhere in the line
+    if "(p" in line_lower:
+        return True
+    # "Name to verb..."
+    parts = line.split(None, 2)
+    return len(parts) == 3 and parts[1].lower() == "to" and parts[0].isalpha()
+
 
 def parse_meeting_notes(text: str) -> list[ActionItem]:
     """Extract action items from unstructured meeting-note text.
@@ -297,51 +513,50 @@ def parse_meeting_notes(text: str) -> list[ActionItem]:
     list[ActionItem]
         Zero or more action items found in *text*, in document order.
     """
+    # str.splitlines() also breaks on \v, \f, \x1c-\x1e, \x85, \u2028 and
+    # \u2029 (e.g. soft line breaks pasted from word processors), which
+    # io.StringIO does not; only those rare documents pay for the full list.
+    if _RE_EXTRA_LINE_BREAKS.search(text):
+        return _parse_lines(text.splitlines())
+    # Otherwise iterate lazily rather than materializing every line up front;
+    # universal newline mode keeps "\r\n" and bare "\r" line endings working.
+    return _parse_lines(io.StringIO(text, newline=None))
+
+
+def _parse_lines(lines: Iterable[str]) -> list[ActionItem]:
+    """Extract action items from already-split lines, in order.
+
+    Lines may keep or omit their trailing newline.
+    """
     items: list[ActionItem] = []
+    classify = _RE_CLASSIFIER.match
+    today = date.today()
 
-    for raw_line in text.splitlines():
+    for raw_line in lines:
         line = raw_line.strip()
         if not line:
             continue
 
+        line_lower = _lower_preserving_offsets(line)
+
         # ---- Skip non-action lines ----
+        if not _may_be_action(line, line_lower):
+            continue
         if _RE_DECISION.search(line):
             continue
 
         task_text: str | None = None
         owner = "unassigned"
 
-        # 1) "TODO: ..."
-        m = _RE_TODO.match(line)
+        # 1-5) Prefix patterns and "Name to verb..." in a single match
+        m = classify(line)
         if m:
-            task_text = m.group(1)
-
-        # 2) "Action: ..."
-        if task_text is None:
-            m = _RE_ACTION.match(line)
-            if m:
-                task_text = m.group(1)
-
-        # 3) "ACTION ITEM -- ..."
-        if task_text is None:
-            m = _RE_ACTION_ITEM.match(line)
-            if m:
-                task_text = m.group(1)
-
-        # 4) "Reminder: ..."
-        if task_text is None:
-            m = _RE_REMINDER.match(line)
-            if m:
-                task_text = m.group(1)
-
-        # 5) "Name to verb..." pattern
-        if task_text is None:
-            m = _RE_NAME_TO_VERB.match(line)
-            if m:
-                owner = m.group(1)
-                verb = m.group(2)
-                rest = m.group(3) or ""
-                task_text = f"{verb}{rest}".strip()
+            match m.lastgroup:
+                case "todo" | "action" | "action_item" | "reminder":
+                    task_text = m.group(f"{m.lastgroup}_text")
+                case "name_to_verb":
+                    owner = m.group("owner")
+                    task_text = f"{m.group('verb')}{m.group('rest') or ''}".strip()
 
         # 6) Lines with a priority tag like (P1) that are not decisions
         if task_text is None and _RE_PRIORITY_TAG.search(line):
@@ -352,23 +567,27 @@ def parse_meeting_notes(text: str) -> list[ActionItem]:
             continue
 
         # ---- Extract metadata ----
+        priority, paren_owner_span = _scan_inline_tags(line_lower)
+
         # Owner: check full original line first so we don't miss metadata
-        extracted_owner = _extract_owner(line)
+        extracted_owner = _extract_owner(line, paren_owner_span)
         if extracted_owner != "unassigned":
             owner = extracted_owner
         # (owner from "Name to verb" pattern is already set above)
 
-        due = _extract_due_date(line)
-        priority = _extract_priority(line)
+        due = _extract_due_date(line, today)
 
         # ---- Clean task text ----
         clean_task = _clean_task_text(task_text)
         if not clean_task:
             continue
 
+        # Owners repeat heavily across a document; interning makes every
+        # item for the same person share one string object.  Priorities are
+        # already shared via the _PRIORITY_MAP literals.
         items.append(ActionItem(
             task=clean_task,
-            owner=owner,
+            owner=sys.intern(owner),
             due_date=due,
             priority=priority,
             raw_line=raw_line.strip(),
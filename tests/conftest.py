@@ -2,14 +2,55 @@
 
 from __future__ import annotations
 
+import re
+from collections.abc import Callable, Iterator
+from datetime import date, timedelta
+
 import pytest
+from freezegun import freeze_time
+
+from actionize.parser import (
+    ActionItem,
+    _parse_lines,
+    normalize_date,
+    parse_meeting_notes,
+)
+from tests.golden import GOLDEN_LINES
+
+# One checklist line of format_markdown output.
+_BULLET_RE = re.compile(r"(?m)^- \[ \] .*$")
+
+
+# Every date-relative expectation in the suite is written against this day.
+FROZEN_TODAY = "2026-02-06"
+
 
-from actionize.parser import ActionItem
+@pytest.fixture(scope="session", autouse=True)
+def _frozen_clock() -> Iterator[None]:
+    """Pin ``date.today()`` to FROZEN_TODAY (a Friday) for the session."""
+    with freeze_time(FROZEN_TODAY, ignore=["_pytest.timing"]):
+        yield
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session", autouse=True)
+def _warmup_parsers(_frozen_clock: None) -> None:
+    """Exercise each date path and the line parser once before any test.
+
+    Pays first-call costs up front so they are not billed to whichever
+    test happens to run first.
+    """
+    normalize_date("2026-01-01")
+    normalize_date("March 1")
+    normalize_date("next Monday")
+    parse_meeting_notes("TODO: warm cache")
+
+
+@pytest.fixture(scope="session")
 def sample_action_item() -> ActionItem:
-    """Return a fully-populated ActionItem for use in formatter tests."""
+    """Return a fully-populated ActionItem for use in formatter tests.
+
+    ActionItem is frozen, so one instance is shared across the session.
+    """
     return ActionItem(
         task="Draft the Q1 budget proposal",
         owner="Alice",
@@ -17,3 +58,39 @@ def sample_action_item() -> ActionItem:
         priority="high",
         raw_line="ACTION: Alice to draft the Q1 budget proposal by Feb 14 [high]",
     )
+
+
+@pytest.fixture(scope="session")
+def trivial_item() -> ActionItem:
+    """Return a task-only ActionItem with every other field defaulted.
+
+    ActionItem is frozen, so one instance is shared across the session.
+    """
+    return ActionItem(task="X")
+
+
+@pytest.fixture(scope="session")
+def golden_parsed_items() -> list[ActionItem]:
+    """Parse the golden meeting notes once for the whole test session.
+
+    ActionItem is frozen, so sharing the parsed list across tests is safe.
+    """
+    return _parse_lines(GOLDEN_LINES)
+
+
+@pytest.fixture(scope="session")
+def today_iso() -> str:
+    """Return today's date as an ISO-8601 string, snapshotted once."""
+    return date.today().isoformat()
+
+
+@pytest.fixture(scope="session")
+def tomorrow_iso() -> str:
+    """Return tomorrow's date as an ISO-8601 string, snapshotted once."""
+    return (date.today() + timedelta(days=1)).isoformat()
+
+
+@pytest.fixture(scope="session")
+def bullet_lines() -> Callable[[str], list[str]]:
+    """Return a function listing the ``- [ ]`` checklist lines of Markdown."""
+    return _BULLET_RE.findall
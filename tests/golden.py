@@ -0,0 +1,67 @@
+"""Golden meeting-notes input and the items it must parse to."""
+
+from __future__ import annotations
+
+
+# The canonical meeting-notes sample used as the golden input.
+GOLDEN_INPUT = """\
+Kickoff sync \u2014 Decisions: use SSO for internal users.
+
+TODO: Update onboarding doc. Owner: Priya. Due: next Friday.
+
+Action: Reach out to vendor about pricing tiers (owner Sam) due 2/20
+
+We should probably fix flaky CI tests soon (P1)
+
+John to draft API rate limit proposal by March 1
+
+Reminder: Send customer follow-up email (no owner yet)
+
+Decision: move launch to Q2.
+
+ACTION ITEM \u2014 Migrate staging database; Owner: Mei; Due: 2026-02-28; Priority: P0
+"""
+
+# GOLDEN_INPUT pre-split once at import, for fixtures that parse by line.
+GOLDEN_LINES = GOLDEN_INPUT.splitlines()
+
+# The due_date for item 1 ("next Friday") is computed relative to the
+# session's frozen clock (2026-02-06), one week later.
+GOLDEN_EXPECTED: list[dict[str, str]] = [
+    {
+        "task": "Update onboarding doc",
+        "owner": "Priya",
+        "due_date": "2026-02-13",
+        "priority": "normal",
+    },
+    {
+        "task": "Reach out to vendor about pricing tiers",
+        "owner": "Sam",
+        "due_date": "2026-02-20",
+        "priority": "normal",
+    },
+    {
+        "task": "We should probably fix flaky CI tests soon",
+        "owner": "unassigned",
+        "due_date": "",
+        "priority": "high",
+    },
+    {
+        "task": "draft API rate limit proposal",
+        "owner": "John",
+        "due_date": "2026-03-01",
+        "priority": "normal",
+    },
+    {
+        "task": "Send customer follow-up email",
+        "owner": "unassigned",
+        "due_date": "",
+        "priority": "normal",
+    },
+    {
+        "task": "Migrate staging database",
+        "owner": "Mei",
+        "due_date": "2026-02-28",
+        "priority": "critical",
+    },
+]
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
@@ -94,14 +95,24 @@ class TestCLIEndToEnd:
         assert data["count"] == 6
 
     def test_markdown_contains_checkboxes(
-        self, input_file: Path, output_dir: Path
+        self,
+        input_file: Path,
+        output_dir: Path,
+        bullet_lines: Callable[[str], list[str]],
     ) -> None:
         """The Markdown file contains checkbox lines."""
         main([str(input_file), "--out", str(output_dir)])
         md_path = output_dir / "action_items.md"
         content = md_path.read_text(encoding="utf-8")
-        checkbox_lines = [l for l in content.splitlines() if l.startswith("- [ ]")]
-        assert len(checkbox_lines) == 6
+        assert len(bullet_lines(content)) == 6
+
+    def test_output_files_use_lf_line_endings(
+        self, input_file: Path, output_dir: Path
+    ) -> None:
+        """Both output files end lines with '\\n', whatever the platform."""
+        main([str(input_file), "--out", str(output_dir)])
+        for name in ("action_items.md", "action_items.json"):
+            assert b"\r" not in (output_dir / name).read_bytes()
 
     def test_output_dir_created_if_missing(
         self, input_file: Path, tmp_path: Path
@@ -116,6 +127,54 @@ class TestCLIEndToEnd:
         assert (nested_dir / "action_items.json").exists()
 
 
+class TestCLIMultipleInputs:
+    """Tests for running the CLI over several input files at once."""
+
+    @pytest.mark.slow
+    def test_each_file_gets_its_own_subdirectory(self, tmp_path: Path) -> None:
+        """Every input writes its outputs under a directory named for its stem."""
+        first = tmp_path / "standup.txt"
+        first.write_text(MEETING_NOTES, encoding="utf-8")
+        second = tmp_path / "retro.txt"
+        second.write_text("TODO: Book the room.\n", encoding="utf-8")
+        out_dir = tmp_path / "out"
+
+        rc = main([str(first), str(second), "--out", str(out_dir)])
+
+        assert rc == 0
+        standup = json.loads((out_dir / "standup" / "action_items.json").read_text(encoding="utf-8"))
+        retro = json.loads((out_dir / "retro" / "action_items.json").read_text(encoding="utf-8"))
+        assert standup["count"] == 6
+        assert retro["count"] == 1
+        assert (out_dir / "retro" / "action_items.md").exists()
+
+    def test_duplicate_stems_return_one(self, tmp_path: Path) -> None:
+        """Inputs whose outputs would collide are rejected before any work."""
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        first = tmp_path / "a" / "notes.txt"
+        second = tmp_path / "b" / "notes.txt"
+        first.write_text(MEETING_NOTES, encoding="utf-8")
+        second.write_text(MEETING_NOTES, encoding="utf-8")
+        out_dir = tmp_path / "out"
+
+        rc = main([str(first), str(second), "--out", str(out_dir)])
+
+        assert rc == 1
+        assert not out_dir.exists()
+
+    def test_any_missing_file_returns_one(self, tmp_path: Path) -> None:
+        """A single missing input aborts the whole batch."""
+        present = tmp_path / "present.txt"
+        present.write_text(MEETING_NOTES, encoding="utf-8")
+        out_dir = tmp_path / "out"
+
+        rc = main([str(present), str(tmp_path / "missing.txt"), "--out", str(out_dir)])
+
+        assert rc == 1
+        assert not out_dir.exists()
+
+
 class TestCLIMissingInput:
     """Tests for error handling when the input file is missing."""
 
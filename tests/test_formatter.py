@@ -2,11 +2,21 @@
 
 from __future__ import annotations
 
+import io
 import json
+from collections.abc import Callable
+from pathlib import Path
 
 import pytest
 
-from actionize.formatter import format_json, format_markdown, sort_items
+from actionize import formatter
+from actionize.formatter import (
+    format_json,
+    format_json_bytes,
+    format_markdown,
+    sort_items,
+    write_json,
+)
 from actionize.parser import ActionItem
 
 
@@ -134,7 +144,7 @@ class TestFormatMarkdown:
         assert result == "# Action Items\n\n_No action items found._\n"
 
     def test_single_normal_item(self) -> None:
-        """A single item with normal priority renders without a priority tag."""
+        """A single normal-priority item renders as one checklist line."""
         items = [
             ActionItem(
                 task="Write docs",
@@ -145,20 +155,20 @@ class TestFormatMarkdown:
         ]
         result = format_markdown(items)
         assert "- [ ] Write docs @Alice (due 2026-03-01)" in result
-        # Normal priority should NOT have a tag
-        assert "[normal]" not in result
 
-    def test_high_priority_tag(self) -> None:
-        """High priority items show the [high] tag."""
-        items = [ActionItem(task="Fix bug", priority="high")]
-        result = format_markdown(items)
-        assert "[high]" in result
-
-    def test_critical_priority_tag(self) -> None:
-        """Critical priority items show the [critical] tag."""
-        items = [ActionItem(task="Outage", priority="critical")]
-        result = format_markdown(items)
-        assert "[critical]" in result
+    @pytest.mark.parametrize(
+        "priority,tag,present",
+        [
+            ("high", "[high]", True),
+            ("critical", "[critical]", True),
+            # Normal priority should NOT have a tag
+            ("normal", "[normal]", False),
+        ],
+    )
+    def test_priority_tag(self, priority: str, tag: str, present: bool) -> None:
+        """Only non-normal priorities render a [priority] tag."""
+        result = format_markdown([ActionItem(task="X", priority=priority)])
+        assert (tag in result) is present
 
     def test_owner_prefix(self) -> None:
         """Assigned owners appear as @Owner in the output."""
@@ -184,43 +194,44 @@ class TestFormatMarkdown:
         result = format_markdown(items)
         assert "(due" not in result
 
-    def test_heading_present(self) -> None:
+    def test_heading_present(self, trivial_item: ActionItem) -> None:
         """Output always starts with the '# Action Items' heading."""
-        result = format_markdown([ActionItem(task="X")])
+        result = format_markdown([trivial_item])
         assert result.startswith("# Action Items\n")
 
-    def test_trailing_newline(self) -> None:
+    def test_trailing_newline(self, trivial_item: ActionItem) -> None:
         """Output ends with a trailing newline."""
-        result = format_markdown([ActionItem(task="X")])
+        result = format_markdown([trivial_item])
         assert result.endswith("\n")
 
-    def test_items_are_sorted_in_output(self) -> None:
+    def test_items_are_sorted_in_output(
+        self, bullet_lines: Callable[[str], list[str]]
+    ) -> None:
         """format_markdown sorts items internally before rendering."""
         items = [
             ActionItem(task="Zulu task", owner="Zara"),
             ActionItem(task="Alpha task", owner="Alice"),
         ]
-        result = format_markdown(items)
-        lines = [l for l in result.splitlines() if l.startswith("- [ ]")]
+        lines = bullet_lines(format_markdown(items))
         assert "Alpha task" in lines[0]
         assert "Zulu task" in lines[1]
 
-    def test_checkbox_format(self) -> None:
+    def test_checkbox_format(
+        self,
+        bullet_lines: Callable[[str], list[str]],
+        trivial_item: ActionItem,
+    ) -> None:
         """Each action item line starts with '- [ ] '."""
-        items = [ActionItem(task="Checkbox test")]
-        result = format_markdown(items)
-        assert "- [ ] Checkbox test" in result
+        lines = bullet_lines(format_markdown([trivial_item]))
+        assert lines == [f"- [ ] {trivial_item.task}"]
 
-    def test_multiple_items_each_on_own_line(self) -> None:
-        """Multiple items produce one checkbox line each."""
-        items = [
-            ActionItem(task="A", owner="Alice"),
-            ActionItem(task="B", owner="Bob"),
-            ActionItem(task="C", owner="Charlie"),
-        ]
-        result = format_markdown(items)
-        checkbox_lines = [l for l in result.splitlines() if l.startswith("- [ ]")]
-        assert len(checkbox_lines) == 3
+    @pytest.mark.parametrize("n", [1, 3, 10, 100])
+    def test_multiple_items_each_on_own_line(
+        self, bullet_lines: Callable[[str], list[str]], n: int
+    ) -> None:
+        """Any number of items produces one checkbox line each."""
+        items = [ActionItem(task=f"T{i}", owner=f"O{i}") for i in range(n)]
+        assert len(bullet_lines(format_markdown(items))) == n
 
     def test_conftest_fixture_renders(self, sample_action_item: ActionItem) -> None:
         """The shared sample_action_item fixture from conftest renders properly."""
@@ -235,9 +246,26 @@ class TestFormatMarkdown:
 # ===================================================================
 
 
+# A fully-populated item, as both ActionItem kwargs and its JSON object.
+_EXPECTED_FULL_ITEM: dict[str, str] = {
+    "task": "Full item",
+    "owner": "Grace",
+    "due_date": "2026-04-01",
+    "priority": "high",
+    "raw_line": "original line",
+}
+
+
 class TestFormatJson:
     """Unit tests for the format_json function."""
 
+    @pytest.fixture(scope="class")
+    @classmethod
+    def full_item_json(cls) -> tuple[str, dict]:
+        """Format one fully-populated item once; return the text and its parse."""
+        result = format_json([ActionItem(**_EXPECTED_FULL_ITEM)])
+        return result, json.loads(result)
+
     def test_empty_list_valid_json(self) -> None:
         """An empty items list produces valid JSON with count 0."""
         result = format_json([])
@@ -245,19 +273,23 @@ class TestFormatJson:
         assert data["count"] == 0
         assert data["action_items"] == []
 
-    def test_output_is_valid_json(self) -> None:
+    def test_output_is_valid_json(self, full_item_json: tuple[str, dict]) -> None:
         """Output is always valid JSON regardless of content."""
-        items = [ActionItem(task="Parse me", owner="Tester", due_date="2026-01-01")]
-        data = json.loads(format_json(items))
+        _, data = full_item_json
         assert isinstance(data, dict)
 
-    def test_keys_are_sorted(self) -> None:
-        """Top-level JSON keys appear in alphabetical order (sort_keys=True)."""
-        result = format_json([ActionItem(task="X")])
-        # "action_items" should come before "count" alphabetically
-        ai_pos = result.index('"action_items"')
-        count_pos = result.index('"count"')
-        assert ai_pos < count_pos
+    def test_keys_are_sorted(self, trivial_item: ActionItem) -> None:
+        """Top-level JSON keys appear in alphabetical order."""
+        result = format_json([trivial_item])
+        # json.loads preserves document order, so the parsed keys reflect it.
+        # The order comes from how the payload is built, not from sort_keys.
+        assert list(json.loads(result)) == ["action_items", "count"]
+
+    def test_item_keys_are_sorted(self, full_item_json: tuple[str, dict]) -> None:
+        """Keys within each serialized item appear in alphabetical order."""
+        _, data = full_item_json
+        keys = list(data["action_items"][0])
+        assert keys == sorted(keys)
 
     def test_count_matches_items(self) -> None:
         """The 'count' field matches the number of action_items."""
@@ -270,24 +302,10 @@ class TestFormatJson:
         assert data["count"] == 3
         assert len(data["action_items"]) == 3
 
-    def test_item_fields_present(self) -> None:
+    def test_item_fields_present(self, full_item_json: tuple[str, dict]) -> None:
         """Each serialized item contains all ActionItem fields."""
-        items = [
-            ActionItem(
-                task="Full item",
-                owner="Grace",
-                due_date="2026-04-01",
-                priority="high",
-                raw_line="original line",
-            )
-        ]
-        data = json.loads(format_json(items))
-        item_dict = data["action_items"][0]
-        assert item_dict["task"] == "Full item"
-        assert item_dict["owner"] == "Grace"
-        assert item_dict["due_date"] == "2026-04-01"
-        assert item_dict["priority"] == "high"
-        assert item_dict["raw_line"] == "original line"
+        _, data = full_item_json
+        assert data["action_items"][0] == _EXPECTED_FULL_ITEM
 
     def test_items_are_sorted_in_output(self) -> None:
         """format_json sorts items internally before serializing."""
@@ -299,17 +317,55 @@ class TestFormatJson:
         assert data["action_items"][0]["owner"] == "Alice"
         assert data["action_items"][1]["owner"] == "Zara"
 
-    def test_trailing_newline(self) -> None:
+    def test_trailing_newline(self, full_item_json: tuple[str, dict]) -> None:
         """JSON output ends with a trailing newline."""
-        result = format_json([])
+        result, _ = full_item_json
         assert result.endswith("\n")
 
-    def test_indented_output(self) -> None:
+    def test_indented_output(self, full_item_json: tuple[str, dict]) -> None:
         """JSON output uses 2-space indentation."""
-        result = format_json([ActionItem(task="Indented")])
+        result, _ = full_item_json
         # The "action_items" key should be indented 2 spaces inside the object
         assert '  "action_items"' in result
 
+    def test_stream_to_file_matches_string(self) -> None:
+        """Streaming into a file object writes exactly the returned string."""
+        items = [ActionItem(task="Stream me", owner="Hana", due_date="2026-01-01")]
+        buffer = io.StringIO()
+        assert format_json(items, buffer) is None
+        assert buffer.getvalue() == format_json(items)
+
+    def test_bytes_match_string(self, sample_action_item: ActionItem) -> None:
+        """format_json_bytes is the UTF-8 encoding of format_json."""
+        items = [sample_action_item, ActionItem(task="Caf\u00e9 \u2014 sync")]
+        assert format_json_bytes(items) == format_json(items).encode("utf-8")
+
+    def test_stdlib_fallback_matches(
+        self, sample_action_item: ActionItem, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Output is identical whether or not orjson is available."""
+        items = [sample_action_item, ActionItem(task="Caf\u00e9 \u2014 sync")]
+        expected = format_json(items)
+        monkeypatch.setattr(formatter, "orjson", None)
+        assert format_json(items) == expected
+        assert format_json_bytes(items) == expected.encode("utf-8")
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_write_json(
+        self,
+        sample_action_item: ActionItem,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        use_orjson: bool,
+    ) -> None:
+        """write_json writes format_json's document byte for byte."""
+        expected = format_json([sample_action_item]).encode("utf-8")
+        if not use_orjson:
+            monkeypatch.setattr(formatter, "orjson", None)
+        path = tmp_path / "items.json"
+        write_json([sample_action_item], path)
+        assert path.read_bytes() == expected
+
     def test_conftest_fixture_serializes(self, sample_action_item: ActionItem) -> None:
         """The shared sample_action_item fixture from conftest serializes properly."""
         data = json.loads(format_json([sample_action_item]))